@@ -1,8 +1,9 @@
 import os
 import csv
 import random
-from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Dict, List, Set, Tuple, Optional
 
 import pygame
 
@@ -11,6 +12,17 @@ TITLE = "Snake: Korean Vocab Edition"
 CELL = 32                     # pixel size of one grid cell
 GRID_W, GRID_H = 20, 15       # grid size in cells -> 640x480 window
 WIDTH, HEIGHT = GRID_W * CELL, GRID_H * CELL
+ALL_CELLS = [(c, r) for c in range(GRID_W) for r in range(GRID_H)]
+GRID_PX = [[(c * CELL, r * CELL) for r in range(GRID_H)] for c in range(GRID_W)]  # GRID_PX[col][row] -> pixel top-left
+# Directions are indices into DIRS; opposite directions differ by 2, so d ^ cur == 2 means reversal
+DIR_RIGHT, DIR_DOWN, DIR_LEFT, DIR_UP = 0, 1, 2, 3
+DIRS = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+DIR_KEYS = {
+    pygame.K_RIGHT: DIR_RIGHT, pygame.K_d: DIR_RIGHT,
+    pygame.K_DOWN: DIR_DOWN, pygame.K_s: DIR_DOWN,
+    pygame.K_LEFT: DIR_LEFT, pygame.K_a: DIR_LEFT,
+    pygame.K_UP: DIR_UP, pygame.K_w: DIR_UP,
+}
 FPS_BASE = 3                  # base speed (frames per second for snake moves) -- slowed down
 FONT_NAME = None              # use default; you can set to a .ttf path
 HUD_HEIGHT = 48               # top HUD padding (drawn within game area, not extra)
@@ -29,113 +41,119 @@ ITEM_EN = (93, 226, 231)
 HUD_TEXT = (239, 195, 202)
 ITEM_BG = (25, 65, 100)
 SHADOW = (0, 0, 0)
+ITEM_COLORS = {'korean': ITEM_KR, 'english': ITEM_EN}
 
 # --------------------------- Data --------------------------- #
 
-@dataclass
-class Vocab:
-    korean: str
-    english: str
+# Vocab is stored column-wise: (korean words, english words), same index = same pair
+Vocab = Tuple[List[str], List[str]]
 
-@dataclass
 class Item:
-    text: str
-    lang: str            # "korean" or "english"
-    is_correct: bool     # True only for the target korean item
-    pos: Tuple[int, int] # grid coordinate (col,row)
-    rect: Optional[pygame.Rect] = None  # pixel rect after render (set each frame)
+    # __slots__ instead of a dataclass: no per-instance __dict__
+    __slots__ = ('text', 'lang', 'is_correct', 'pos', 'rect', 'surf', 'text_rect', 'cells')
+
+    def __init__(self, text: str, lang: str, is_correct: bool, pos: Tuple[int, int]):
+        self.text = text
+        self.lang = lang              # "korean" or "english"
+        self.is_correct = is_correct  # True only for the target korean item
+        self.pos = pos                # grid coordinate (col,row)
+        self.rect: Optional[pygame.Rect] = None       # pixel rect of the background pill (set at spawn)
+        self.surf: Optional[pygame.Surface] = None    # pre-rendered text (set at spawn)
+        self.text_rect: Optional[pygame.Rect] = None  # where surf is blitted (set at spawn)
+        self.cells: List[Tuple[int, int]] = []        # grid cells the text overlaps (set at spawn)
 
 # Built-in fallback vocab
-BUILTIN_VOCAB: List[Vocab] = [
-    Vocab("mul", "water"),
-    Vocab("annyeong", "hello"),
-    Vocab("gamsahamnida", "thank you"),
-    Vocab("bap", "rice"),
-    Vocab("sarang", "love"),
-    Vocab("mianhae", "sorry"),
-    Vocab("nae", "yes"),
-    Vocab("ani", "no"),
-    Vocab("juseyo", "please"),
-    Vocab("eolmayo", "how much"),
-    Vocab("jip", "house"),
-    Vocab("sigan", "time"),
-    Vocab("saram","person"),
-    Vocab("chingu","friend"),
-    Vocab("gajok","family"),
-    Vocab("hakgyo","school"),
-    Vocab("hoesa","office"),
-    Vocab("byeongwon","hospital"),
-    Vocab("sijang","market"),
-    Vocab("eumsik","food"),
-    Vocab("oneul","today"),
-    Vocab("naeil","tomorrow"),
-    Vocab("eoje","yesterday"),
-    Vocab("nalssi","weather"),
-    Vocab("hana","one"),
-    Vocab("dul","two"),
-    Vocab("set","three"),
-    Vocab("yeol","ten"),
-    Vocab("baek","hundred"),
-    Vocab("sarang","love"),
-    Vocab("haengbok","happiness"),
-    Vocab("seulpeum","sadness"),
-    Vocab("hwa","anger"),
-    Vocab("utda","smile"),
-    Vocab("meokda","to_eat"),
-    Vocab("masida","to_drink"),
-    Vocab("gada","to_go"),
-    Vocab("oda","to_come"),
-    Vocab("jada","to sleep"),
-    Vocab("gi=ongwon","park"),
-    Vocab("doseogwan","library"),
-    Vocab("gyohoe","church"),
-    Vocab("gage","store"),
-    Vocab("eunhaeng","bank"),
-    Vocab("ucheguk","post office"),
-    Vocab("sikdang","restaurant"),
-    Vocab("kape","cafe"),
-    Vocab("gonghang","airport"),
-    Vocab("bada","sea"),
-    Vocab("chaek","book"),
+_BUILTIN_PAIRS = [
+    ("mul", "water"),
+    ("annyeong", "hello"),
+    ("gamsahamnida", "thank you"),
+    ("bap", "rice"),
+    ("sarang", "love"),
+    ("mianhae", "sorry"),
+    ("nae", "yes"),
+    ("ani", "no"),
+    ("juseyo", "please"),
+    ("eolmayo", "how much"),
+    ("jip", "house"),
+    ("sigan", "time"),
+    ("saram", "person"),
+    ("chingu", "friend"),
+    ("gajok", "family"),
+    ("hakgyo", "school"),
+    ("hoesa", "office"),
+    ("byeongwon", "hospital"),
+    ("sijang", "market"),
+    ("eumsik", "food"),
+    ("oneul", "today"),
+    ("naeil", "tomorrow"),
+    ("eoje", "yesterday"),
+    ("nalssi", "weather"),
+    ("hana", "one"),
+    ("dul", "two"),
+    ("set", "three"),
+    ("yeol", "ten"),
+    ("baek", "hundred"),
+    ("sarang", "love"),
+    ("haengbok", "happiness"),
+    ("seulpeum", "sadness"),
+    ("hwa", "anger"),
+    ("utda", "smile"),
+    ("meokda", "to_eat"),
+    ("masida", "to_drink"),
+    ("gada", "to_go"),
+    ("oda", "to_come"),
+    ("jada", "to sleep"),
+    ("gi=ongwon", "park"),
+    ("doseogwan", "library"),
+    ("gyohoe", "church"),
+    ("gage", "store"),
+    ("eunhaeng", "bank"),
+    ("ucheguk", "post office"),
+    ("sikdang", "restaurant"),
+    ("kape", "cafe"),
+    ("gonghang", "airport"),
+    ("bada", "sea"),
+    ("chaek", "book"),
 ]
+BUILTIN_KR = [k for k, _ in _BUILTIN_PAIRS]
+BUILTIN_EN = [e for _, e in _BUILTIN_PAIRS]
+BUILTIN_VOCAB: Vocab = (BUILTIN_KR, BUILTIN_EN)
 
 # --------------------------- Helpers --------------------------- #
 
-def load_vocab_csv(path: str = "vocab.csv") -> List[Vocab]:
+def load_vocab_csv(path: str = "vocab.csv") -> Vocab:
+    kr: List[str] = []
+    en: List[str] = []
     if not os.path.exists(path):
-        return []
-    out: List[Vocab] = []
+        return kr, en
     with open(path, newline='', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         for row in reader:
             k = (row.get('korean') or '').strip()
             e = (row.get('english') or '').strip()
             if k and e:
-                out.append(Vocab(k, e))
-    return out
+                kr.append(k)
+                en.append(e)
+    return kr, en
 
 
-def grid_to_px(col: int, row: int) -> Tuple[int, int]:
-    return col * CELL, row * CELL
-
-
-def random_free_cell(occupied: set) -> Tuple[int, int]:
-    while True:
-        p = (random.randrange(GRID_W), random.randrange(GRID_H))
-        if p not in occupied:
-            return p
+def free_cells(occupied: set) -> List[Tuple[int, int]]:
+    return [p for p in ALL_CELLS if p not in occupied]
 
 
+@lru_cache(maxsize=256)
 def level_from_score(score: int) -> int:
     # Every 50 points, level up (1-based)
     return max(1, score // 50 + 1)
 
 
+@lru_cache(maxsize=256)
 def speed_from_level(level: int) -> int:
     # Increase speed modestly with level
     return FPS_BASE + (level - 1) * 2
 
 
+@lru_cache(maxsize=256)
 def distractor_count_from_level(level: int) -> int:
     return min(2 + level, MAX_DISTRACTORS_PER_LEVEL)
 
@@ -143,101 +161,155 @@ def distractor_count_from_level(level: int) -> int:
 # --------------------------- Game --------------------------- #
 
 class SnakeGame:
-    def __init__(self, screen: pygame.Surface, vocab: List[Vocab]):
+    def __init__(self, screen: pygame.Surface, vocab: Vocab):
         self.screen = screen
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(FONT_NAME, 20)
         self.font_small = pygame.font.Font(FONT_NAME, 16)
         self.title_font = pygame.font.Font(FONT_NAME, 24)
+        # The grid never changes, so draw it once and blit it every frame
+        self.bg_surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self.bg_surface.fill(BG)
+        # Subtle grid
+        for x in range(0, WIDTH, CELL):
+            pygame.draw.line(self.bg_surface, GRID_DARK, (x, 0), (x, HEIGHT))
+        for y in range(0, HEIGHT, CELL):
+            pygame.draw.line(self.bg_surface, GRID_DARK, (0, y), (WIDTH, y))
+        # Item background pills (shadow + bg) pre-rendered per (w, h)
+        self._pill_cache: Dict[Tuple[int, int], pygame.Surface] = {}
+        # HUD text only changes with score/lives/target, re-rendered when dirty
+        self._hud_cache: Dict[str, pygame.Surface] = {}
+        self._hud_dirty = True
         self.reset(vocab)
 
-    def reset(self, vocab: List[Vocab]):
-        self.vocab = vocab[:] if vocab else BUILTIN_VOCAB[:]
-        random.shuffle(self.vocab)
+    def reset(self, vocab: Vocab):
+        self.kr, self.en = vocab if vocab[0] else BUILTIN_VOCAB
+        self.vocab = (self.kr, self.en)
+        self._has_distinct_pairs = len(set(zip(self.kr, self.en))) > 1
         # Snake starts center
         start = (GRID_W // 2, GRID_H // 2)
-        self.snake: List[Tuple[int, int]] = [start, (start[0]-1, start[1]), (start[0]-2, start[1])]
-        self.direction = (1, 0)  # moving right
-        self.pending_dir: Optional[Tuple[int, int]] = None
+        self.snake: Deque[Tuple[int, int]] = deque([start, (start[0]-1, start[1]), (start[0]-2, start[1])])
+        self.snake_set: Set[Tuple[int, int]] = set(self.snake)  # mirrors self.snake for O(1) lookups
+        self.direction = DIR_RIGHT
+        self.pending_dir: Optional[int] = None
         self.move_timer = 0.0
         self.score = 0
         self.lives = LIVES_START
         self.game_over = False
         self.paused = False
+        self._dirty = True  # redraw needed on the next frame
 
-        self.target: Optional[Vocab] = None
+        self.target: Optional[int] = None  # index into self.kr / self.en
         self.items: List[Item] = []
+        self.items_by_cell: Dict[Tuple[int, int], Item] = {}
         self.spawn_new_round()
 
     # --------------- Round/Items --------------- #
     def spawn_new_round(self):
         # Choose a new target different from previous if possible
         prev = self.target
-        choices = [v for v in self.vocab if v != prev] or self.vocab
-        self.target = random.choice(choices)
+        n = len(self.kr)
+        i = random.randrange(n)
+        if prev is not None and self._has_distinct_pairs:
+            # Redraw until the pair differs; duplicate entries of prev count as prev too
+            prev_pair = (self.kr[prev], self.en[prev])
+            while (self.kr[i], self.en[i]) == prev_pair:
+                i = random.randrange(n)
+        self.target = i
+        target_kr = self.kr[self.target]
         self.items.clear()
+        self.items_by_cell.clear()
+        self._hud_dirty = True
 
-        occupied = set(self.snake)
-        # Correct Korean item for the target
-        pos_correct = random_free_cell(occupied)
-        occupied.add(pos_correct)
-        self.items.append(Item(text=self.target.korean, lang='korean', is_correct=True, pos=pos_correct))
-
-        # Distractors: mix of wrong korean + some english words
         level = level_from_score(self.score)
         n_distractors = distractor_count_from_level(level)
 
-        pool_wrong_kr = [v.korean for v in self.vocab if v.korean != self.target.korean]
-        pool_en = [v.english for v in self.vocab]
-        random.shuffle(pool_wrong_kr)
-        random.shuffle(pool_en)
+        # Place every item at once on distinct free cells
+        free = free_cells(self.snake_set)
+        if not free:
+            # The snake fills the board: nowhere left to place a word
+            self.game_over = True
+            return
+        positions = random.sample(free, min(1 + n_distractors, len(free)))
+
+        # Correct Korean item for the target
+        self.add_item(Item(text=target_kr, lang='korean', is_correct=True, pos=positions[0]))
+
+        # Distractors: mix of wrong korean + some english words
+        # Sample one spare korean word so dropping the target still leaves enough
+        n_kr = (n_distractors + 1) // 2
+        pool_wrong_kr = [k for k in random.sample(self.kr, min(n_kr + 1, n)) if k != target_kr][:n_kr]
+        pool_en = random.sample(self.en, min(n_distractors, n))
 
-        for i in range(n_distractors):
+        for i, pos in enumerate(positions[1:]):
             if i % 2 == 0 and pool_wrong_kr:
                 text = pool_wrong_kr.pop()
                 lang = 'korean'
             else:
-                text = pool_en.pop() if pool_en else random.choice(pool_wrong_kr or [self.target.korean])
+                text = pool_en.pop() if pool_en else random.choice(pool_wrong_kr or [target_kr])
                 lang = 'english'
-            pos = random_free_cell(occupied)
-            occupied.add(pos)
-            self.items.append(Item(text=text, lang=lang, is_correct=False, pos=pos))
+            self.add_item(Item(text=text, lang=lang, is_correct=False, pos=pos))
+
+    def add_item(self, item: Item):
+        # Item text and position are fixed for the round, so render once here
+        item.surf = self.font.render(item.text, True, ITEM_COLORS[item.lang]).convert_alpha()
+        ipx, ipy = GRID_PX[item.pos[0]][item.pos[1]]
+        pad_x, pad_y = 8, 4
+        bg_rect = item.surf.get_rect()
+        bg_rect.center = (ipx + CELL // 2, ipy + CELL // 2)
+        bg_rect.inflate_ip(pad_x*2, pad_y*2)
+        item.rect = bg_rect
+        item.text_rect = item.surf.get_rect(center=bg_rect.center)
+        # Words are usually wider than a cell; every cell the text overlaps is a hit
+        tr = item.text_rect
+        item.cells = [(c, r)
+                      for c in range(max(0, tr.left // CELL), min(GRID_W, (tr.right - 1) // CELL + 1))
+                      for r in range(max(0, tr.top // CELL), min(GRID_H, (tr.bottom - 1) // CELL + 1))]
+        self.items.append(item)
+        self.index_item(item)
+
+    def index_item(self, item: Item):
+        # Earlier items keep cells they share with later ones, as when items were scanned in order
+        for cell in item.cells:
+            self.items_by_cell.setdefault(cell, item)
+
+    def remove_item(self, item: Item):
+        self.items.remove(item)
+        for cell in item.cells:
+            if self.items_by_cell.get(cell) is item:
+                del self.items_by_cell[cell]
+        # Hand shared cells back to any remaining item that overlaps them
+        for other in self.items:
+            self.index_item(other)
 
     # --------------- Update/Draw --------------- #
     def handle_input(self):
         for event in pygame.event.get():
+            # Any event (keys, window expose/focus) may change what is on screen
+            self._dirty = True
             if event.type == pygame.QUIT:
                 pygame.quit()
                 raise SystemExit
             elif event.type == pygame.KEYDOWN:
-                if event.key in (pygame.K_ESCAPE,):
+                if event.key == pygame.K_ESCAPE:
                     pygame.quit()
                     raise SystemExit
-                if event.key in (pygame.K_p,):
+                if event.key == pygame.K_p:
                     self.paused = not self.paused
-                if self.game_over and event.key in (pygame.K_r,):
+                if self.game_over and event.key == pygame.K_r:
                     self.reset(self.vocab)
                     return
 
                 # Movement
                 if not self.game_over and not self.paused:
-                    if event.key in (pygame.K_UP, pygame.K_w):
-                        self.set_pending_dir((0, -1))
-                    elif event.key in (pygame.K_DOWN, pygame.K_s):
-                        self.set_pending_dir((0, 1))
-                    elif event.key in (pygame.K_LEFT, pygame.K_a):
-                        self.set_pending_dir((-1, 0))
-                    elif event.key in (pygame.K_RIGHT, pygame.K_d):
-                        self.set_pending_dir((1, 0))
-
-    def set_pending_dir(self, d: Tuple[int, int]):
-        # Prevent reversing into itself
-        if len(self.snake) >= 2:
-            head = self.snake[0]
-            neck = self.snake[1]
-            cur = (head[0]-neck[0], head[1]-neck[1])
-            if (d[0] == -cur[0] and d[1] == -cur[1]):
-                return
+                    d = DIR_KEYS.get(event.key)
+                    if d is not None:
+                        self.set_pending_dir(d)
+
+    def set_pending_dir(self, d: int):
+        # Prevent reversing into itself (self.direction is the last move made)
+        if d ^ self.direction == 2:
+            return
         self.pending_dir = d
 
     def step(self, dt: float):
@@ -250,99 +322,96 @@ class SnakeGame:
         while self.move_timer >= step_time:
             self.move_timer -= step_time
             self.move_snake()
+            self._dirty = True
 
     def move_snake(self):
-        if self.pending_dir:
+        if self.pending_dir is not None:
             self.direction = self.pending_dir
             self.pending_dir = None
         head = self.snake[0]
-        new_head = (head[0] + self.direction[0], head[1] + self.direction[1])
+        dx, dy = DIRS[self.direction]
+        new_head = (head[0] + dx, head[1] + dy)
 
         # Wall collision
         if not (0 <= new_head[0] < GRID_W and 0 <= new_head[1] < GRID_H):
             self.game_over = True
             return
         # Self collision
-        if new_head in self.snake:
+        if new_head in self.snake_set:
             self.game_over = True
             return
 
-        self.snake.insert(0, new_head)
-
-        # Check item collisions (pixel rect collision using approximate rect for head)
-        head_px = pygame.Rect(*grid_to_px(*new_head), CELL, CELL)
-        ate_any = False
-        to_remove = None
-        for item in self.items:
-            # Create/update item's pixel rect from its text render size around its cell center
-            # We'll compute rect later in draw; for collision during logic we create a similar rect
-            ipx, ipy = grid_to_px(*item.pos)
-            text_surf = self.font.render(item.text, True, ITEM_KR if item.lang == 'korean' else ITEM_EN)
-            rect = text_surf.get_rect()
-            rect.center = (ipx + CELL // 2, ipy + CELL // 2)
-            if head_px.colliderect(rect):
-                ate_any = True
-                to_remove = item
-                if item.is_correct and item.lang == 'korean' and item.text == self.target.korean:
-                    self.score += SCORE_CORRECT
-                    # Grow: keep tail
-                    self.spawn_new_round()
-                else:
-                    # Wrong item penalty: lose life and shrink if possible
-                    self.score = max(0, self.score + SCORE_WRONG)
-                    self.lives -= 1
-                    if len(self.snake) > 3:
-                        self.snake.pop()
-                    if self.lives < 0:
-                        self.game_over = True
-                break
+        self.snake.appendleft(new_head)
+        self.snake_set.add(new_head)
+
+        # Check item collisions: the head hits any item whose text overlaps its cell
+        item = self.items_by_cell.get(new_head)
+        ate_any = item is not None
+        if item is not None:
+            self.remove_item(item)
+            if item.is_correct and item.lang == 'korean' and item.text == self.kr[self.target]:
+                self.score += SCORE_CORRECT
+                # Grow: keep tail
+                self.spawn_new_round()
+            else:
+                # Wrong item penalty: lose life and shrink if possible
+                self.score = max(0, self.score + SCORE_WRONG)
+                self.lives -= 1
+                self._hud_dirty = True
+                if len(self.snake) > 3:
+                    self.snake_set.discard(self.snake.pop())
+                if self.lives < 0:
+                    self.game_over = True
 
         if not ate_any:
             # Move normally: remove tail
-            self.snake.pop()
+            self.snake_set.discard(self.snake.pop())
 
     def draw_grid(self):
-        self.screen.fill(BG)
-        # Subtle grid
-        for x in range(0, WIDTH, CELL):
-            pygame.draw.line(self.screen, GRID_DARK, (x, 0), (x, HEIGHT))
-        for y in range(0, HEIGHT, CELL):
-            pygame.draw.line(self.screen, GRID_DARK, (0, y), (WIDTH, y))
+        self.screen.blit(self.bg_surface, (0, 0))
 
     def draw_snake(self):
+        # Local names for attribute lookups repeated per segment
+        screen, draw_rect, grid_px = self.screen, pygame.draw.rect, GRID_PX
         for i, (cx, cy) in enumerate(self.snake):
-            x, y = grid_to_px(cx, cy)
-            rect = pygame.Rect(x+2, y+2, CELL-4, CELL-4)
+            x, y = grid_px[cx][cy]
+            rect = (x+2, y+2, CELL-4, CELL-4)
             color = SNAKE_HEAD if i == 0 else SNAKE_BODY
-            pygame.draw.rect(self.screen, color, rect, border_radius=6)
+            draw_rect(screen, color, rect, border_radius=6)
 
     def draw_items(self):
+        blit, pill_surface = self.screen.blit, self.pill_surface
         for item in self.items:
-            col = ITEM_KR if item.lang == 'korean' else ITEM_EN
-            ipx, ipy = grid_to_px(*item.pos)
-            # Render text & a subtle background pill
-            text = self.font.render(item.text, True, col)
-            pad_x, pad_y = 8, 4
-            bg_rect = text.get_rect()
-            bg_rect.center = (ipx + CELL // 2, ipy + CELL // 2)
-            bg_rect.inflate_ip(pad_x*2, pad_y*2)
-            # Shadow
-            shadow = bg_rect.copy(); shadow.move_ip(2, 2)
-            pygame.draw.rect(self.screen, SHADOW, shadow, border_radius=10)
-            pygame.draw.rect(self.screen, ITEM_BG, bg_rect, border_radius=10)
+            # Text & background pill were prepared in add_item
+            bg_rect = item.rect
+            blit(pill_surface(bg_rect.size), bg_rect)
             # Text on top
-            self.screen.blit(text, text.get_rect(center=bg_rect.center))
-            # Store rect for potential external use
-            item.rect = bg_rect
+            blit(item.surf, item.text_rect)
+
+    def pill_surface(self, size: Tuple[int, int]) -> pygame.Surface:
+        pill = self._pill_cache.get(size)
+        if pill is None:
+            w, h = size
+            pill = pygame.Surface((w + 2, h + 2), pygame.SRCALPHA)
+            # Shadow
+            pygame.draw.rect(pill, SHADOW, (2, 2, w, h), border_radius=10)
+            pygame.draw.rect(pill, ITEM_BG, (0, 0, w, h), border_radius=10)
+            pill = pill.convert_alpha()
+            self._pill_cache[size] = pill
+        return pill
 
     def draw_hud(self):
         # Top HUD: Target English, score, lives, level
-        level = level_from_score(self.score)
-        target_text = f"Find: {self.target.english}" if self.target else "Find: —"
-        info_text = f"Score: {self.score}   Lives: {self.lives}   Level: {level}"
-
-        left = self.title_font.render(target_text, True, HUD_TEXT)
-        right = self.font_small.render(info_text, True, HUD_TEXT)
+        if self._hud_dirty:
+            level = level_from_score(self.score)
+            target_text = f"Find: {self.en[self.target]}" if self.target is not None else "Find: —"
+            info_text = f"Score: {self.score}   Lives: {self.lives}   Level: {level}"
+            self._hud_cache['left'] = self.title_font.render(target_text, True, HUD_TEXT).convert_alpha()
+            self._hud_cache['right'] = self.font_small.render(info_text, True, HUD_TEXT).convert_alpha()
+            self._hud_dirty = False
+
+        left = self._hud_cache['left']
+        right = self._hud_cache['right']
         self.screen.blit(left, (12, 8))
         self.screen.blit(right, (12, 12 + left.get_height()))
 
@@ -371,12 +440,15 @@ class SnakeGame:
 
     # --------------- Main loop --------------- #
     def run(self):
-        # Use a fixed-timestep mover driven by dt
+        # Use a fixed-timestep mover driven by dt; input is polled at 60 Hz but
+        # the screen is only redrawn when the game state changed
         while True:
             dt = self.clock.tick(60) / 1000.0
             self.handle_input()
             self.step(dt)
-            self.draw()
+            if self._dirty:
+                self.draw()
+                self._dirty = False
 
 
 # --------------------------- Main --------------------------- #
@@ -387,7 +459,7 @@ def main():
     screen = pygame.display.set_mode((WIDTH, HEIGHT))
 
     vocab = load_vocab_csv()
-    if not vocab:
+    if not vocab[0]:
         vocab = BUILTIN_VOCAB
 
     game = SnakeGame(screen, vocab)